@@ -1,18 +1,40 @@
 import logging
 from typing import Dict, Union, cast
 
-from fastapi import APIRouter, HTTPException, UploadFile
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile
+from fastapi.responses import ORJSONResponse
 
-from ..core.dependencies import (get_anthropic_service, get_mongodb_service,
-                                 get_ocr_service, get_template_service,
-                                 get_validation_service)
+from ..core.dependencies import (provide_anthropic_service,
+                                 provide_document_batcher,
+                                 provide_ocr_service, provide_template_service,
+                                 provide_validation_service)
 from ..models.hr_data import HRData
+from ..services.anthropic_service import AnthropicService
+from ..services.document_batcher import DocumentBatcher
+from ..services.ocr_service import OCRService
+from ..services.template_service import TemplateService
+from ..services.validation_service import ValidationService
+from .routing import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+
+# The default template and the role list are static, so their JSON is
+# serialized once at import and the same bytes are served on every request
+_static_templates = TemplateService()
+_DEFAULT_TEMPLATE_JSON = orjson.dumps(_static_templates.get_default_template())
+_AVAILABLE_ROLES_JSON = orjson.dumps({"roles": _static_templates.get_available_roles()})
 
 
 @router.post("/process-pdf", response_model=Dict)
-async def process_pdf(file: UploadFile):
+async def process_pdf(
+    file: UploadFile,
+    ocr_service: OCRService = Depends(provide_ocr_service),
+    anthropic_service: AnthropicService = Depends(provide_anthropic_service),
+    validation_service: ValidationService = Depends(provide_validation_service),
+    template_service: TemplateService = Depends(provide_template_service),
+):
     """
     Process a PDF document to extract HR data using OCR and AI enhancement.
     
@@ -31,10 +53,6 @@ async def process_pdf(file: UploadFile):
         raise HTTPException(status_code=400, detail="File must be a PDF")
     
     try:
-        # Get services
-        ocr_service = get_ocr_service()
-        anthropic_service = get_anthropic_service()
-        
         # Read the uploaded file
         contents = await file.read()
         
@@ -51,7 +69,6 @@ async def process_pdf(file: UploadFile):
         # Create HR data directly from AI extraction instead of using OCR fallback
         if ai_extracted_data:
             # Use validation service to convert JSON to HRData model
-            validation_service = get_validation_service()
             validated_hr_data = validation_service.validate_hr_data(ai_extracted_data)
             
             # If validation successful, return the validated data with empty errors
@@ -68,11 +85,9 @@ async def process_pdf(file: UploadFile):
                 }
         
         # Fallback: create empty template if AI extraction fails
-        template_service = get_template_service()
         fallback_data = template_service.get_empty_template()
         fallback_data['name'] = 'Extracted from PDF'  # Add minimal indication
         
-        validation_service = get_validation_service()
         validated_hr_data = validation_service.validate_hr_data(fallback_data)
         
         # Return both HR data and any validation errors
@@ -95,7 +110,11 @@ async def process_pdf(file: UploadFile):
 
 
 @router.post("/store-document", response_model=Dict)
-async def store_document(data: Dict):
+async def store_document(
+    data: Dict,
+    validation_service: ValidationService = Depends(provide_validation_service),
+    document_batcher: DocumentBatcher = Depends(provide_document_batcher),
+):
     """
     Validate and store HR data in the database.
     
@@ -109,10 +128,6 @@ async def store_document(data: Dict):
         HTTPException: If validation fails or storage fails
     """
     try:
-        # Get services
-        validation_service = get_validation_service()
-        mongodb_service = get_mongodb_service()
-        
         # Validate the data
         validated_data = validation_service.validate_hr_data(data)
         
@@ -128,8 +143,8 @@ async def store_document(data: Dict):
         hr_data_obj = cast(HRData, validated_data)
         document_data = hr_data_obj.model_dump()
         
-        # Store in MongoDB
-        document_id = mongodb_service.store_document(document_data)
+        # Store in MongoDB, batched with any concurrent requests
+        document_id = await document_batcher.store_document(document_data)
         
         return {"status": "success", "document_id": document_id}
     except HTTPException:
@@ -139,32 +154,39 @@ async def store_document(data: Dict):
         raise HTTPException(status_code=500, detail="Failed to store document")
 
 
-@router.get("/template", response_model=Dict)
+@router.get("/template")
 async def get_template():
     """
     Get the default HR data template for initial form values.
     
+    The template is static, so its JSON is serialized once at import and
+    the same bytes are returned on every request.
+    
     Returns:
         Default template data dictionary
     """
-    template_service = get_template_service()
-    return template_service.get_default_template()
+    return Response(content=_DEFAULT_TEMPLATE_JSON, media_type="application/json")
 
 
-@router.get("/template/roles", response_model=Dict)
+@router.get("/template/roles")
 async def get_available_roles():
     """
     Get list of available role templates.
     
+    The roles are static, so their JSON is serialized once at import and
+    the same bytes are returned on every request.
+    
     Returns:
         Dictionary containing list of available roles
     """
-    template_service = get_template_service()
-    return {"roles": template_service.get_available_roles()}
+    return Response(content=_AVAILABLE_ROLES_JSON, media_type="application/json")
 
 
 @router.get("/template/{role}", response_model=Dict)
-async def get_template_by_role(role: str):
+async def get_template_by_role(
+    role: str,
+    template_service: TemplateService = Depends(provide_template_service),
+):
     """
     Get a role-specific HR data template.
     
@@ -174,27 +196,38 @@ async def get_template_by_role(role: str):
     Returns:
         Role-specific template data dictionary
     """
-    template_service = get_template_service()
     return template_service.get_template_by_role(role)
 
 
-@router.post("/validate", response_model=Dict)
-async def validate_data(data: Dict):
+@router.post("/validate")
+async def validate_data(
+    data: Dict,
+    validation_service: ValidationService = Depends(provide_validation_service),
+):
     """
     Validate HR data without storing it.
     
+    The validated model is dumped once in JSON mode and the response is
+    serialized directly, skipping FastAPI's jsonable_encoder pass.
+    
     Args:
         data: HR data dictionary to validate
         
     Returns:
         Validation status and errors if any
     """
-    validation_service = get_validation_service()
-    return validation_service.validate_data_without_storing(data)
+    result = validation_service.validate_data_without_storing(data)
+    if result["data"] is not None:
+        result = {**result, "data": result["data"].model_dump(mode="json")}
+    return ORJSONResponse(result)
 
 
 @router.post("/summarize-pdf", response_model=Dict)
-async def summarize_pdf(file: UploadFile):
+async def summarize_pdf(
+    file: UploadFile,
+    ocr_service: OCRService = Depends(provide_ocr_service),
+    anthropic_service: AnthropicService = Depends(provide_anthropic_service),
+):
     """
     Generate a summary of the PDF document content.
     
@@ -211,10 +244,6 @@ async def summarize_pdf(file: UploadFile):
         raise HTTPException(status_code=400, detail="File must be a PDF")
     
     try:
-        # Get services
-        ocr_service = get_ocr_service()
-        anthropic_service = get_anthropic_service()
-        
         # Read the uploaded file
         contents = await file.read()
         
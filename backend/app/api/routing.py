@@ -0,0 +1,33 @@
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is decoded with orjson instead of stdlib json.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so malformed
+    bodies still surface as FastAPI's 422 validation error.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route that hands its endpoint an ORJSONRequest.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
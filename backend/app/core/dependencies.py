@@ -3,6 +3,7 @@ from functools import lru_cache
 import logging
 
 from ..services.anthropic_service import AnthropicService
+from ..services.document_batcher import DocumentBatcher
 from ..services.validation_service import ValidationService
 from ..services.template_service import TemplateService
 from ..services.mongodb_service import MongoDBService
@@ -36,6 +37,7 @@ class ServiceContainer:
             self._services['anthropic'] = AnthropicService()
             self._services['mongodb'] = MongoDBService()
             self._services['ocr'] = OCRService()
+            self._services['document_batcher'] = DocumentBatcher(self._services['mongodb'])
             
             self._initialized = True
             logging.info("All services initialized successfully")
@@ -86,6 +88,10 @@ class ServiceContainer:
         """Get the OCR service instance."""
         return self.get_service('ocr')
 
+    def get_document_batcher(self) -> DocumentBatcher:
+        """Get the document batcher instance."""
+        return self.get_service('document_batcher')
+
     def shutdown_services(self):
         """
         Shutdown all services and cleanup resources.
@@ -148,6 +154,11 @@ def get_ocr_service() -> OCRService:
     return get_service_container().get_ocr_service()
 
 
+def get_document_batcher() -> DocumentBatcher:
+    """Get document batcher instance."""
+    return get_service_container().get_document_batcher()
+
+
 def initialize_services():
     """Initialize all application services."""
     get_service_container().initialize_services()
@@ -155,4 +166,27 @@ def initialize_services():
 
 def shutdown_services():
     """Shutdown all application services."""
-    get_service_container().shutdown_services() 
\ No newline at end of file
+    get_service_container().shutdown_services() 
+
+# Async providers for FastAPI's Depends. FastAPI runs plain-def dependencies in
+# the threadpool, one thread handoff per dependency per request, while async
+# ones are awaited inline. Endpoints depend on these and tests override them;
+# direct callers keep using the get_* functions above
+async def provide_anthropic_service() -> AnthropicService:
+    return get_anthropic_service()
+
+
+async def provide_validation_service() -> ValidationService:
+    return get_validation_service()
+
+
+async def provide_template_service() -> TemplateService:
+    return get_template_service()
+
+
+async def provide_ocr_service() -> OCRService:
+    return get_ocr_service()
+
+
+async def provide_document_batcher() -> DocumentBatcher:
+    return get_document_batcher()
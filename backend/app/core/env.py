@@ -0,0 +1,14 @@
+import os
+
+from dotenv import load_dotenv
+
+# Set once .env has been loaded; inherited by reload and worker processes
+ENV_LOADED_FLAG = "CATA_ENV_LOADED"
+
+
+def load_env() -> None:
+    """Load the .env file once per process tree; variables already set win."""
+    if os.getenv(ENV_LOADED_FLAG) == "1":
+        return
+    load_dotenv(override=False)
+    os.environ[ENV_LOADED_FLAG] = "1"
@@ -1,17 +1,17 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 import sys
 import traceback
 from datetime import datetime
 from app.api.endpoints import router
+from app.core.env import load_env
 from app.core.dependencies import initialize_services, shutdown_services
-from dotenv import load_dotenv
 import os
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file unless run.py already did
+load_env()
 
 # Configure logging
 logging.basicConfig(
@@ -24,7 +24,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="HR Document OCR API",
     description="API for processing HR documents using OCR",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -86,4 +87,4 @@ app.include_router(router, prefix="/v1")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()} 
\ No newline at end of file
+    return ORJSONResponse({"status": "healthy", "timestamp": datetime.now().isoformat()}) 
\ No newline at end of file
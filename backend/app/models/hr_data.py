@@ -54,18 +54,20 @@ class WorkExperience(BaseModel):
         return technologies
     
     def update_work_experience(self, work_experience):
-        self.company = work_experience.company
-        self.position = work_experience.position
-        self.start_date = work_experience.start_date
-        self.end_date = work_experience.end_date
-        self.current_job = work_experience.current_job
-        self.description = work_experience.description
-        self.achievements = work_experience.achievements
-        self.technologies_used = work_experience.technologies_used
-        
-        return self
+        # Instances are frozen, so return an updated copy instead of mutating self
+        return self.model_copy(update={
+            'company': work_experience.company,
+            'position': work_experience.position,
+            'start_date': work_experience.start_date,
+            'end_date': work_experience.end_date,
+            'current_job': work_experience.current_job,
+            'description': work_experience.description,
+            'achievements': work_experience.achievements,
+            'technologies_used': work_experience.technologies_used,
+        })
 
     class Config:
+        frozen = True
         error_msg_templates = {
             'value_error.any_str.min_length': 'A descrição deve ter pelo menos {limit_value} caracteres',
             'value_error.any_str.min_length.position': 'O cargo deve ter pelo menos {limit_value} caracteres',
@@ -144,9 +146,9 @@ class HRData(BaseModel):
         return self
     
     def update_work_experience(self, work_experience: WorkExperience):
-        for exp in self.work_experience:
+        for i, exp in enumerate(self.work_experience):
             if exp.company == work_experience.company and exp.position == work_experience.position:
-                exp.update_work_experience(work_experience)
+                self.work_experience[i] = exp.update_work_experience(work_experience)
                 return self
         return self
     class Config:
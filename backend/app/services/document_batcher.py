@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from .mongodb_service import MongoDBService
+
+
+class DocumentBatcher:
+    """
+    Coalesces concurrent document store requests into bulk inserts.
+
+    Documents submitted while a batch is open are written together with a
+    single MongoDBService.store_documents_bulk call. Each caller gets back
+    the ID of its own document, or the error for that document alone.
+    """
+
+    def __init__(self, mongodb_service: MongoDBService, max_batch_size: int = 100,
+                 max_delay: float = 0.002):
+        self.mongodb_service = mongodb_service
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: List[Tuple[Dict, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        logging.info("Document batcher initialized")
+
+    async def store_document(self, hr_data: Dict) -> str:
+        """
+        Queue a document for the next bulk insert and wait for its ID.
+
+        Args:
+            hr_data: Document to store
+
+        Returns:
+            ID of the stored document
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((hr_data, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Write every pending document with one bulk insert."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            results = self.mongodb_service.store_documents_bulk([doc for doc, _ in batch])
+        except Exception as e:
+            logging.error(f"Error storing batch of {len(batch)} documents: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Each document succeeds or fails on its own
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        # Never leave a caller waiting if the bulk call returned too few results
+        if len(results) != len(batch):
+            error = RuntimeError(f"Bulk insert returned {len(results)} results for {len(batch)} documents")
+            logging.error(str(error))
+            for _, future in batch[len(results):]:
+                if not future.done():
+                    future.set_exception(error)
+
+    def shutdown(self) -> None:
+        """Flush any documents still waiting for a batch."""
+        self._flush()
@@ -6,19 +6,34 @@ from fastapi import HTTPException
 from ..models.hr_data import HRData, WorkExperience
 
 
+# Strips the CPF punctuation so formatted input never goes through filter()
+_CPF_PUNCTUATION = str.maketrans("", "", ".-/ ")
+
+# Error details shared by the HTTPExceptions raised below
+ERR_INVALID_CPF = "CPF inválido. Todas as operações requerem um CPF válido."
+ERR_OVERLAP = "Experiência profissional com datas sobrepostas a uma experiência existente"
+ERR_NO_EXP = "Índice de experiência profissional não encontrado"
+ERR_INVALID_SKILL_TYPE = "Tipo de habilidade deve ser 'hard' ou 'main'"
+ERR_SHORT_SKILL = "Habilidade deve ter pelo menos 2 caracteres"
+ERR_DUP_SKILL = "Habilidade '{}' já existe na lista"
+ERR_NO_SKILL = "Habilidade '{}' não encontrada na lista"
+
+
 class HRService:
     def __init__(self, hr_data: HRData):
         self.hr_data = hr_data
         if not self._is_valid_cpf(hr_data.cpf):
             raise HTTPException(
                 status_code=400,
-                detail="CPF inválido. Todas as operações requerem um CPF válido."
+                detail=ERR_INVALID_CPF
             )
 
     def _is_valid_cpf(self, cpf: str) -> bool:
         """Validate if the CPF is valid according to Brazilian rules."""
         # Remove any non-digit characters
-        cpf_digits = ''.join(filter(str.isdigit, cpf))
+        cpf_digits = cpf.translate(_CPF_PUNCTUATION)
+        if not cpf_digits.isdigit():
+            cpf_digits = ''.join(filter(str.isdigit, cpf))
         
         # Check if it's a complete CPF (11 digits)
         if len(cpf_digits) != 11:
@@ -47,18 +62,20 @@ class HRService:
         if not self._is_valid_cpf(self.hr_data.cpf):
             raise HTTPException(
                 status_code=400,
-                detail="CPF inválido. Todas as operações requerem um CPF válido."
+                detail=ERR_INVALID_CPF
             )
 
     def add_work_experience(self, experience: WorkExperience) -> None:
         """Add a new work experience to the HR data."""
         self._validate_cpf()
+        now = datetime.now()
+
         # Validate if dates overlap with existing experiences
         for existing_exp in self.hr_data.work_experience:
-            if self._dates_overlap(existing_exp, experience):
+            if self._dates_overlap(existing_exp, experience, now):
                 raise HTTPException(
                     status_code=400,
-                    detail="Experiência profissional com datas sobrepostas a uma experiência existente"
+                    detail=ERR_OVERLAP
                 )
         
         self.hr_data.work_experience.append(experience)
@@ -69,15 +86,17 @@ class HRService:
         if not 0 <= index < len(self.hr_data.work_experience):
             raise HTTPException(
                 status_code=404,
-                detail="Índice de experiência profissional não encontrado"
+                detail=ERR_NO_EXP
             )
 
+        now = datetime.now()
+
         # Validate if dates overlap with other experiences
         for i, existing_exp in enumerate(self.hr_data.work_experience):
-            if i != index and self._dates_overlap(existing_exp, experience):
+            if i != index and self._dates_overlap(existing_exp, experience, now):
                 raise HTTPException(
                     status_code=400,
-                    detail="Experiência profissional com datas sobrepostas a uma experiência existente"
+                    detail=ERR_OVERLAP
                 )
 
         self.hr_data.work_experience[index] = experience
@@ -88,7 +107,7 @@ class HRService:
         if not 0 <= index < len(self.hr_data.work_experience):
             raise HTTPException(
                 status_code=404,
-                detail="Índice de experiência profissional não encontrado"
+                detail=ERR_NO_EXP
             )
         
         self.hr_data.work_experience.pop(index)
@@ -99,14 +118,14 @@ class HRService:
         if skill_type not in ["hard", "main"]:
             raise HTTPException(
                 status_code=400,
-                detail="Tipo de habilidade deve ser 'hard' ou 'main'"
+                detail=ERR_INVALID_SKILL_TYPE
             )
 
         skill = skill.strip()
         if len(skill) < 2:
             raise HTTPException(
                 status_code=400,
-                detail="Habilidade deve ter pelo menos 2 caracteres"
+                detail=ERR_SHORT_SKILL
             )
 
         target_list = self.hr_data.hard_skills if skill_type == "hard" else self.hr_data.main_skills
@@ -120,7 +139,7 @@ class HRService:
         if skill in target_list:
             raise HTTPException(
                 status_code=400,
-                detail=f"Habilidade '{skill}' já existe na lista"
+                detail=ERR_DUP_SKILL.format(skill)
             )
 
         target_list.append(skill)
@@ -131,14 +150,14 @@ class HRService:
         if skill_type not in ["hard", "main"]:
             raise HTTPException(
                 status_code=400,
-                detail="Tipo de habilidade deve ser 'hard' ou 'main'"
+                detail=ERR_INVALID_SKILL_TYPE
             )
 
         target_list = self.hr_data.hard_skills if skill_type == "hard" else self.hr_data.main_skills
         if not target_list or skill not in target_list:
             raise HTTPException(
                 status_code=404,
-                detail=f"Habilidade '{skill}' não encontrada na lista"
+                detail=ERR_NO_SKILL.format(skill)
             )
 
         target_list.remove(skill)
@@ -146,25 +165,28 @@ class HRService:
     def calculate_total_experience(self) -> timedelta:
         """Calculate total work experience time."""
         self._validate_cpf()
+        now = datetime.now()
         total_time = timedelta()
         
         for exp in self.hr_data.work_experience:
-            end_date = exp.end_date if not exp.current_job else datetime.now()
+            end_date = exp.end_date if not exp.current_job else now
             if end_date and exp.start_date:
                 total_time += end_date - exp.start_date
 
         return total_time
 
-    def _dates_overlap(self, exp1: WorkExperience, exp2: WorkExperience) -> bool:
-        """Check if two work experiences have overlapping dates."""
-        def get_end_date(exp: WorkExperience) -> datetime:
-            if exp.current_job:
-                return datetime.now()
-            if exp.end_date is None:
-                return exp.start_date  # If no end_date and not current_job, use start_date as end_date
-            return exp.end_date
+    @staticmethod
+    def _end_date(exp: WorkExperience, now: datetime) -> datetime:
+        """End of the experience: now for current jobs, start_date when no end_date is set."""
+        if exp.current_job:
+            return now
+        if exp.end_date is None:
+            return exp.start_date
+        return exp.end_date
 
-        start1, end1 = exp1.start_date, get_end_date(exp1)
-        start2, end2 = exp2.start_date, get_end_date(exp2)
+    def _dates_overlap(self, exp1: WorkExperience, exp2: WorkExperience, now: datetime) -> bool:
+        """Check if two work experiences have overlapping dates."""
+        start1, end1 = exp1.start_date, self._end_date(exp1, now)
+        start2, end2 = exp2.start_date, self._end_date(exp2, now)
 
-        return (start1 <= end2 and start2 <= end1) 
\ No newline at end of file
+        return start1 <= end2 and start2 <= end1
@@ -1,6 +1,7 @@
 from pymongo import MongoClient
+from pymongo.errors import BulkWriteError, WriteError
 import os
-from typing import Dict
+from typing import Dict, List, Union
 import logging
 from datetime import datetime
 from urllib.parse import quote_plus
@@ -28,18 +29,38 @@ class MongoDBService:
         self.db = self.client.hr_documents
         self.collection = self.db.documents
 
-    def store_document(self, hr_data: Dict) -> str:
+    def store_documents_bulk(self, documents: List[Dict]) -> List[Union[str, WriteError]]:
+        """
+        Insert documents in one unordered bulk write.
+        
+        Returns one entry per document, in input order: the inserted ID, or
+        the WriteError for a document the server rejected. The other
+        documents in the batch are still stored. Any other failure is raised.
+        """
         try:
-            # Add timestamp
-            hr_data["created_at"] = datetime.utcnow()
-            
-            # Insert document
-            result = self.collection.insert_one(hr_data)
+            # Add the same timestamp to every document in the batch
+            created_at = datetime.utcnow()
+            for document in documents:
+                document["created_at"] = created_at
             
-            # Return the inserted document's ID
-            return str(result.inserted_id)
+            # Unordered, so one rejected document doesn't stop the rest
+            result = self.collection.insert_many(documents, ordered=False)
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+        except BulkWriteError as e:
+            # A write concern failure leaves every document's durability unknown
+            if e.details.get("writeConcernErrors"):
+                logging.error(f"Error storing documents in MongoDB: {str(e)}")
+                raise
+            # insert_many assigns each document's _id before sending it
+            results: List[Union[str, WriteError]] = [str(document["_id"]) for document in documents]
+            for write_error in e.details.get("writeErrors", []):
+                index = write_error["index"]
+                logging.error(f"Error storing document {index} in MongoDB: {write_error.get('errmsg')}")
+                results[index] = WriteError(write_error.get("errmsg", "Write error"),
+                                            write_error.get("code"), write_error)
+            return results
         except Exception as e:
-            logging.error(f"Error storing document in MongoDB: {str(e)}")
+            logging.error(f"Error storing documents in MongoDB: {str(e)}")
             raise
 
     def __del__(self):
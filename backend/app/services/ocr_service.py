@@ -1,22 +1,48 @@
+import os
 import pytesseract
-from pdf2image.pdf2image import convert_from_bytes
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pdf2image.pdf2image import convert_from_bytes, pdfinfo_from_bytes
 import re
 from datetime import datetime
 from typing import Dict, Any
 from ..models.hr_data import HRData
 
+# Pages rasterised per convert_from_bytes call in extract_text_from_pdf
+_PAGES_PER_CHUNK = 4
+
+# Field patterns for extract_hr_data, compiled once at import
+_NAME_RE = re.compile(r'Nome:?\s*([^\n]+)', re.IGNORECASE)
+_CPF_RE = re.compile(r'\d{3}\.\d{3}\.\d{3}-\d{2}')
+_DATE_RE = re.compile(r'\d{2}/\d{2}/\d{4}')
+_POSITION_RE = re.compile(r'Cargo:?\s*([^\n]+)', re.IGNORECASE)
+_DEPARTMENT_RE = re.compile(r'Departamento:?\s*([^\n]+)', re.IGNORECASE)
+_SALARY_RE = re.compile(r'Salário:?\s*R?\$?\s*(\d+[.,]\d+)', re.IGNORECASE)
+_CONTRACT_RE = re.compile(r'Contrato:?\s*([^\n]+)', re.IGNORECASE)
+
 class OCRService:
     @staticmethod
     def extract_text_from_pdf(pdf_file_bytes: bytes) -> str:
-        # Convert PDF to images
-        images = convert_from_bytes(pdf_file_bytes)
-        
-        # Extract text from each page
-        text = ""
-        for image in images:
-            text += pytesseract.image_to_string(image, lang='por')
-        
-        return text
+        # Rasterise and recognise the PDF a few pages at a time so only one
+        # chunk of page images is held in memory. pytesseract waits on a
+        # tesseract subprocess per page, so a chunk's pages are recognised in
+        # parallel threads and map keeps them in page order. The page count is
+        # read once up front, so a page that fails to render doesn't end the
+        # loop early and drop the pages after it
+        pages = pdfinfo_from_bytes(pdf_file_bytes)["Pages"]
+        workers = min(_PAGES_PER_CHUNK, os.cpu_count() or 1)
+        ocr_page = partial(pytesseract.image_to_string, lang='por')
+        texts = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for first_page in range(1, pages + 1, _PAGES_PER_CHUNK):
+                images = convert_from_bytes(
+                    pdf_file_bytes,
+                    first_page=first_page,
+                    last_page=min(first_page + _PAGES_PER_CHUNK - 1, pages),
+                    thread_count=workers,
+                )
+                texts.extend(executor.map(ocr_page, images))
+        return "".join(texts)
 
     @staticmethod
     def extract_hr_data(text: str) -> Dict[str, Any]:
@@ -30,31 +56,31 @@ class OCRService:
             Dictionary containing extracted HR data
         """
         # Extract name (assuming it follows 'Nome:' or similar pattern)
-        name_match = re.search(r'Nome:?\s*([^\n]+)', text, re.IGNORECASE)
+        name_match = _NAME_RE.search(text)
         name = name_match.group(1).strip() if name_match else ""
 
         # Extract CPF (format: XXX.XXX.XXX-XX)
-        cpf_match = re.search(r'\d{3}\.\d{3}\.\d{3}-\d{2}', text)
+        cpf_match = _CPF_RE.search(text)
         cpf = cpf_match.group(0) if cpf_match else ""
 
         # Extract date (assuming format DD/MM/YYYY)
-        date_match = re.search(r'\d{2}/\d{2}/\d{4}', text)
+        date_match = _DATE_RE.search(text)
         date = datetime.strptime(date_match.group(0), '%d/%m/%Y') if date_match else datetime.now()
 
         # Extract position
-        position_match = re.search(r'Cargo:?\s*([^\n]+)', text, re.IGNORECASE)
+        position_match = _POSITION_RE.search(text)
         position = position_match.group(1).strip() if position_match else None
 
         # Extract department
-        department_match = re.search(r'Departamento:?\s*([^\n]+)', text, re.IGNORECASE)
+        department_match = _DEPARTMENT_RE.search(text)
         department = department_match.group(1).strip() if department_match else None
 
         # Extract salary
-        salary_match = re.search(r'Salário:?\s*R?\$?\s*(\d+[.,]\d+)', text, re.IGNORECASE)
+        salary_match = _SALARY_RE.search(text)
         salary = float(salary_match.group(1).replace(',', '.')) if salary_match else None
 
         # Extract contract type
-        contract_match = re.search(r'Contrato:?\s*([^\n]+)', text, re.IGNORECASE)
+        contract_match = _CONTRACT_RE.search(text)
         contract_type = contract_match.group(1).strip() if contract_match else None
 
         # Return dictionary instead of HRData object
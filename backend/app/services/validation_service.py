@@ -28,8 +28,9 @@ class ValidationService:
             # Convert string dates to datetime objects for validation
             processed_data = self._process_date_fields(data.copy())
             
-            # Create HRData instance even if there are validation errors
-            result["data"] = HRData(**processed_data)
+            # Create HRData instance even if there are validation errors;
+            # model_validate hands the dict straight to the validator
+            result["data"] = HRData.model_validate(processed_data)
             
         except ValidationError as e:
             # Format validation errors but don't raise
@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import app.core.dependencies as dependencies
+from app.core.dependencies import (provide_anthropic_service,
+                                   provide_document_batcher,
+                                   provide_ocr_service,
+                                   provide_validation_service)
+from app.main import app
+from app.services.anthropic_service import AnthropicService
+from app.services.document_batcher import DocumentBatcher
+from app.services.mongodb_service import MongoDBService
+from app.services.ocr_service import OCRService
+from app.services.validation_service import ValidationService
+
+
+class FakeMongoDBService:
+    """Stand-in for MongoDBService that never opens a connection"""
+
+    def store_documents_bulk(self, documents):
+        return ["test_document_id"] * len(documents)
+
+
+class FakeAnthropicService:
+    """Stand-in for AnthropicService that never calls the Claude API"""
+
+    async def analyze_hr_document(self, text):
+        return {"name": "João Silva", "position": "Developer"}
+
+    async def generate_document_summary(self, text):
+        return {"summary": "Test summary", "key_points": ["Point 1", "Point 2"]}
+
+
+class FakeOCRService:
+    """Stand-in for OCRService that skips Poppler and Tesseract"""
+
+    def extract_text_from_pdf(self, pdf_file_bytes):
+        return "Extracted text from PDF"
+
+
+# Mock external services for testing
+@pytest.fixture(scope="session", autouse=True)
+def mock_external_services():
+    """Swap the external service classes used by the service container for fakes"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dependencies, "MongoDBService", FakeMongoDBService)
+        mp.setattr(dependencies, "AnthropicService", FakeAnthropicService)
+        mp.setattr(dependencies, "OCRService", FakeOCRService)
+        yield
+
+
+# In-memory stand-in for the MongoDB collection behind the shared mock
+_STORE = []
+
+def _fake_store_bulk(documents):
+    """Append the documents to _STORE and return sequential IDs for them"""
+    start = len(_STORE)
+    _STORE.extend(documents)
+    return [f"id-{i}" for i in range(start + 1, len(_STORE) + 1)]
+
+
+# Initialize services for testing
+@pytest_asyncio.fixture(scope="session")
+async def setup_services(mock_external_services):
+    """Run the app's startup hooks once before the tests and its shutdown hooks afterwards"""
+    async with app.router.lifespan_context(app):
+        yield
+
+# Create test client fixture
+@pytest_asyncio.fixture(scope="session")
+async def client(setup_services):
+    """Create a single async client dispatching to the app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+# Service mocks installed through FastAPI dependency overrides
+@pytest.fixture(scope="session")
+def service_mocks():
+    """Prebuilt service mocks shared by every test that overrides a dependency"""
+    # spec= limits each mock to the real service's attributes, so a typo fails loudly;
+    # the async methods of AnthropicService come back as AsyncMocks
+    mongodb = Mock(spec=MongoDBService)
+    mongodb.store_documents_bulk.side_effect = _fake_store_bulk
+    validation = Mock(spec=ValidationService)
+    anthropic = Mock(spec=AnthropicService)
+    ocr = Mock(spec=OCRService)
+    ocr.extract_text_from_pdf.return_value = "Extracted text from PDF"
+    return SimpleNamespace(mongodb=mongodb, validation=validation, anthropic=anthropic, ocr=ocr)
+
+@pytest.fixture(scope="session", autouse=True)
+def override_document_batcher(service_mocks):
+    """Route document storage to a batcher over the shared MongoDB mock for the whole session"""
+    batcher = DocumentBatcher(service_mocks.mongodb)
+    app.dependency_overrides[provide_document_batcher] = lambda: batcher
+    yield
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def stored_documents(service_mocks):
+    """Documents written through the shared MongoDB mock, emptied after each test"""
+    service_mocks.mongodb.store_documents_bulk.reset_mock()
+    yield _STORE
+    _STORE.clear()
+
+@pytest.fixture
+def mock_validation_service(service_mocks):
+    """Route the validation dependency to the shared mock for a single test"""
+    # Tests set return values on this session-wide mock; clear them so none leak into the next test
+    service_mocks.validation.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[provide_validation_service] = lambda: service_mocks.validation
+    yield service_mocks.validation
+    del app.dependency_overrides[provide_validation_service]
+
+@pytest.fixture
+def mock_anthropic_service(service_mocks):
+    """Route the Anthropic dependency to the shared mock for a single test"""
+    service_mocks.anthropic.analyze_hr_document.reset_mock()
+    service_mocks.anthropic.generate_document_summary.reset_mock()
+    app.dependency_overrides[provide_anthropic_service] = lambda: service_mocks.anthropic
+    yield service_mocks.anthropic
+    del app.dependency_overrides[provide_anthropic_service]
+
+@pytest.fixture
+def mock_ocr_service(service_mocks):
+    """Route the OCR dependency to the shared mock for a single test"""
+    service_mocks.ocr.extract_text_from_pdf.reset_mock()
+    app.dependency_overrides[provide_ocr_service] = lambda: service_mocks.ocr
+    yield service_mocks.ocr
+    del app.dependency_overrides[provide_ocr_service]
@@ -18,6 +18,7 @@ def service():
 # ---------- CPF VALIDATION ----------
 @pytest.mark.parametrize("cpf", [
     '52998224725',  # válido
+    '529.982.247-25',  # válido formatado
 ])
 def test_valid_cpf(service, cpf):
     assert service.is_valid_cpf(cpf) is True
@@ -27,7 +28,11 @@ def test_valid_cpf(service, cpf):
     '11111111111',
     '12345678900',
     '00000000000',
-    '5299822472'  # curto
+    '5299822472',  # curto
+    '123.456.789-00',  # dígitos verificadores errados, formatado
+    '111.111.111-11',  # todos iguais, formatado
+    '529.982.247-256',  # longo
+    '',  # vazio
 ])
 def test_invalid_cpf(service, cpf):
     assert service.is_valid_cpf(cpf) is False
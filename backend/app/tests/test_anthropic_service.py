@@ -52,7 +52,6 @@ class TestAnthropicService:
         assert "work_experience" in prompt
         assert test_text in prompt
 
-    @pytest.mark.asyncio
     async def test_analyze_hr_document_success(self, anthropic_service, mock_anthropic_client):
         """Test successful HR document analysis"""
         # Mock response structure
@@ -88,7 +87,6 @@ class TestAnthropicService:
         assert call_args[1]["max_tokens"] == 3000
         assert call_args[1]["temperature"] == 0.3
 
-    @pytest.mark.asyncio
     async def test_analyze_hr_document_invalid_json(self, anthropic_service, mock_anthropic_client):
         """Test handling of invalid JSON response"""
         # Mock response with invalid JSON
@@ -106,7 +104,6 @@ class TestAnthropicService:
         # Should return empty dict on JSON parse error
         assert result == {}
 
-    @pytest.mark.asyncio
     async def test_analyze_hr_document_api_error(self, anthropic_service, mock_anthropic_client):
         """Test handling of API errors"""
         # Mock API exception
@@ -118,7 +115,6 @@ class TestAnthropicService:
         # Should return empty dict on API error
         assert result == {}
 
-    @pytest.mark.asyncio
     async def test_analyze_hr_document_empty_response(self, anthropic_service, mock_anthropic_client):
         """Test handling of empty API response"""
         # Mock empty response
@@ -133,7 +129,6 @@ class TestAnthropicService:
         # Should return empty dict
         assert result == {}
 
-    @pytest.mark.asyncio
     async def test_generate_document_summary_success(self, anthropic_service, mock_anthropic_client):
         """Test successful document summarization"""
         # Mock response structure
@@ -163,7 +158,6 @@ class TestAnthropicService:
         assert call_args[1]["max_tokens"] == 1000
         assert call_args[1]["temperature"] == 0.3
 
-    @pytest.mark.asyncio
     async def test_generate_document_summary_invalid_json(self, anthropic_service, mock_anthropic_client):
         """Test handling of invalid JSON in summary response"""
         # Mock response with invalid JSON
@@ -181,7 +175,6 @@ class TestAnthropicService:
         # Should return raw content as summary when JSON parsing fails
         assert result["summary"] == "This is a plain text summary, not JSON"
 
-    @pytest.mark.asyncio
     async def test_generate_document_summary_api_error(self, anthropic_service, mock_anthropic_client):
         """Test handling of API errors in summarization"""
         # Mock API exception
@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from pymongo.errors import BulkWriteError, WriteError
+
+from ..services.document_batcher import DocumentBatcher
+from ..services.mongodb_service import MongoDBService
+
+
+def make_batcher(store_documents_bulk):
+    return DocumentBatcher(Mock(spec=MongoDBService, store_documents_bulk=store_documents_bulk))
+
+async def store_all(batcher, count):
+    return await asyncio.wait_for(
+        asyncio.gather(*(batcher.store_document({"n": i}) for i in range(count)), return_exceptions=True),
+        timeout=1,
+    )
+
+
+# ---------- DOCUMENT BATCHER ----------
+async def test_concurrent_documents_share_one_bulk_insert():
+    store_bulk = Mock(side_effect=lambda documents: [f"id-{doc['n']}" for doc in documents])
+    batcher = make_batcher(store_bulk)
+
+    results = await store_all(batcher, 3)
+
+    assert results == ["id-0", "id-1", "id-2"]
+    store_bulk.assert_called_once()
+
+
+async def test_failed_document_only_fails_its_own_caller():
+    error = WriteError("duplicate key", 11000)
+    batcher = make_batcher(Mock(return_value=["id-0", error, "id-2"]))
+
+    results = await store_all(batcher, 3)
+
+    assert results == ["id-0", error, "id-2"]
+
+
+async def test_missing_results_fail_the_leftover_callers():
+    batcher = make_batcher(Mock(return_value=["id-0"]))
+
+    results = await store_all(batcher, 2)
+
+    assert results[0] == "id-0"
+    assert isinstance(results[1], RuntimeError)
+
+
+async def test_bulk_insert_error_fails_every_caller():
+    error = ConnectionError("MongoDB unavailable")
+    batcher = make_batcher(Mock(side_effect=error))
+
+    results = await store_all(batcher, 2)
+
+    assert results == [error, error]
+
+
+# ---------- MONGODB BULK INSERT ----------
+@pytest.fixture
+def mongodb_service():
+    # Skip __init__, which connects to MongoDB
+    service = MongoDBService.__new__(MongoDBService)
+    service.collection = Mock()
+    return service
+
+
+def test_store_documents_bulk_is_unordered(mongodb_service):
+    mongodb_service.collection.insert_many.return_value = Mock(inserted_ids=["a", "b"])
+
+    assert mongodb_service.store_documents_bulk([{}, {}]) == ["a", "b"]
+    assert mongodb_service.collection.insert_many.call_args.kwargs["ordered"] is False
+
+
+def test_store_documents_bulk_maps_write_errors_to_documents(mongodb_service):
+    def insert_many(documents, ordered):
+        for i, document in enumerate(documents):
+            document["_id"] = f"id-{i}"
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}]})
+    mongodb_service.collection.insert_many.side_effect = insert_many
+
+    results = mongodb_service.store_documents_bulk([{}, {}, {}])
+
+    assert results[0] == "id-0"
+    assert isinstance(results[1], WriteError)
+    assert results[1].code == 11000
+    assert results[2] == "id-2"
+
+
+def test_store_documents_bulk_raises_on_write_concern_error(mongodb_service):
+    mongodb_service.collection.insert_many.side_effect = BulkWriteError(
+        {"writeErrors": [], "writeConcernErrors": [{"code": 64, "errmsg": "waiting for replication timed out"}]}
+    )
+
+    with pytest.raises(BulkWriteError):
+        mongodb_service.store_documents_bulk([{}])
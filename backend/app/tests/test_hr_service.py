@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from ..models.hr_data import HRData, WorkExperience
+from ..services.hr_service import ERR_NO_EXP, ERR_OVERLAP, HRService
+
+
+def make_experience(start_date, end_date=None, current_job=False, company="Tech Corp"):
+    return WorkExperience(
+        company=company,
+        position="Developer",
+        start_date=start_date,
+        end_date=end_date,
+        current_job=current_job,
+        description="Desenvolvimento de aplicações web com foco em escalabilidade",
+    )
+
+@pytest.fixture
+def hr_data():
+    return HRData(
+        name="John Doe",
+        cpf="529.982.247-25",
+        position="Software Engineer",
+        work_experience=[]
+    )
+
+@pytest.fixture
+def service(hr_data):
+    return HRService(hr_data)
+
+
+# ---------- ADD ----------
+def test_add_work_experience(service):
+    exp = make_experience(datetime(2020, 1, 1), datetime(2020, 12, 31))
+    service.add_work_experience(exp)
+    assert service.hr_data.work_experience == [exp]
+
+
+def test_add_overlapping_work_experience(service):
+    service.add_work_experience(make_experience(datetime(2020, 1, 1), datetime(2020, 12, 31)))
+
+    with pytest.raises(HTTPException) as e:
+        service.add_work_experience(make_experience(datetime(2020, 6, 1), datetime(2021, 6, 1)))
+    assert e.value.status_code == 400
+    assert e.value.detail == ERR_OVERLAP
+    assert len(service.hr_data.work_experience) == 1
+
+
+def test_add_overlapping_current_job(service):
+    service.add_work_experience(make_experience(datetime(2020, 1, 1), current_job=True))
+
+    with pytest.raises(HTTPException, match=ERR_OVERLAP):
+        service.add_work_experience(make_experience(datetime(2022, 1, 1), datetime(2022, 6, 1)))
+
+
+@pytest.mark.parametrize("end_time, overlaps", [
+    (datetime(2020, 1, 1, 9), False),   # ends before the next one starts on the same day
+    (datetime(2020, 1, 1, 12), True),   # ends exactly when the next one starts
+    (datetime(2020, 1, 1, 15), True),
+])
+def test_add_same_day_experiences_compare_times(service, end_time, overlaps):
+    service.add_work_experience(make_experience(datetime(2020, 1, 1, 8), end_time))
+    later = make_experience(datetime(2020, 1, 1, 12), datetime(2020, 1, 1, 18))
+
+    if overlaps:
+        with pytest.raises(HTTPException, match=ERR_OVERLAP):
+            service.add_work_experience(later)
+    else:
+        service.add_work_experience(later)
+        assert len(service.hr_data.work_experience) == 2
+
+
+def test_add_sees_experiences_added_through_hr_data(service):
+    # HRData and HRService share the same list, so changes made through either are visible to both
+    service.hr_data.add_work_experience(make_experience(datetime(2020, 1, 1), datetime(2020, 12, 31)))
+
+    with pytest.raises(HTTPException, match=ERR_OVERLAP):
+        service.add_work_experience(make_experience(datetime(2020, 6, 1), datetime(2021, 6, 1)))
+    assert service.calculate_total_experience() == timedelta(days=365)
+
+
+# ---------- UPDATE ----------
+def test_update_work_experience(service):
+    service.add_work_experience(make_experience(datetime(2019, 1, 1), datetime(2019, 12, 31)))
+    service.add_work_experience(make_experience(datetime(2021, 1, 1), datetime(2021, 12, 31)))
+
+    # Overlapping its own previous dates is fine
+    updated = make_experience(datetime(2019, 6, 1), datetime(2020, 6, 1))
+    service.update_work_experience(0, updated)
+    assert service.hr_data.work_experience[0] == updated
+
+
+def test_update_overlapping_work_experience(service):
+    service.add_work_experience(make_experience(datetime(2019, 1, 1), datetime(2019, 12, 31)))
+    service.add_work_experience(make_experience(datetime(2021, 1, 1), datetime(2021, 12, 31)))
+
+    with pytest.raises(HTTPException, match=ERR_OVERLAP):
+        service.update_work_experience(0, make_experience(datetime(2019, 1, 1), datetime(2021, 3, 1)))
+
+
+@pytest.mark.parametrize("index", [-1, 1])
+def test_update_missing_work_experience(service, index):
+    service.add_work_experience(make_experience(datetime(2019, 1, 1), datetime(2019, 12, 31)))
+
+    with pytest.raises(HTTPException) as e:
+        service.update_work_experience(index, make_experience(datetime(2021, 1, 1)))
+    assert e.value.status_code == 404
+    assert e.value.detail == ERR_NO_EXP
+
+
+# ---------- REMOVE ----------
+def test_remove_work_experience(service):
+    first = make_experience(datetime(2019, 1, 1), datetime(2019, 12, 31))
+    second = make_experience(datetime(2021, 1, 1), datetime(2021, 12, 31))
+    service.add_work_experience(first)
+    service.add_work_experience(second)
+
+    service.remove_work_experience(0)
+    assert service.hr_data.work_experience == [second]
+
+    # The removed period is free again
+    service.add_work_experience(make_experience(datetime(2019, 6, 1), datetime(2019, 8, 1)))
+
+
+def test_remove_work_experience_added_through_hr_data(service):
+    service.hr_data.add_work_experience(make_experience(datetime(2019, 1, 1), datetime(2019, 12, 31)))
+
+    service.remove_work_experience(0)
+    assert service.hr_data.work_experience == []
+
+
+def test_remove_missing_work_experience(service):
+    with pytest.raises(HTTPException) as e:
+        service.remove_work_experience(0)
+    assert e.value.status_code == 404
+
+
+# ---------- TOTAL EXPERIENCE ----------
+def test_calculate_total_experience(service):
+    service.add_work_experience(make_experience(datetime(2019, 1, 1), datetime(2019, 1, 11)))
+    service.add_work_experience(make_experience(datetime(2020, 1, 1, 8), datetime(2020, 1, 1, 20)))
+    service.add_work_experience(make_experience(datetime(2021, 1, 1)))  # no end date counts as zero
+
+    assert service.calculate_total_experience() == timedelta(days=10, hours=12)
+
+
+def test_calculate_total_experience_current_job(service):
+    start = datetime.now() - timedelta(days=30)
+    service.add_work_experience(make_experience(start, current_job=True))
+
+    before = datetime.now() - start
+    total = service.calculate_total_experience()
+    assert before <= total <= datetime.now() - start
+
+
+def test_calculate_total_experience_empty(service):
+    assert service.calculate_total_experience() == timedelta()
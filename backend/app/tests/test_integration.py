@@ -1,100 +1,29 @@
-import io
-import json
+import asyncio
+import copy
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from functools import lru_cache
+from types import MappingProxyType
 
+import orjson
 import pytest
-from app.core.dependencies import initialize_services, shutdown_services
+from app.api.endpoints import validate_data
+from app.core.dependencies import get_validation_service
 from app.main import app
-from app.models.hr_data import HRData, WorkExperience
+from app.models.hr_data import HRData
 
-# Try to import with better error handling
-try:
-    from fastapi.testclient import TestClient
-except ImportError as e:
-    pytest.fail(f"Failed to import TestClient: {e}. Please check FastAPI installation.")
 
-try:
-    from app.core.dependencies import initialize_services, shutdown_services
-    from app.main import app
-    from app.models.hr_data import HRData
-except ImportError as e:
-    pytest.fail(f"Failed to import app modules: {e}. Please check app structure and dependencies.")
+# Every test here talks to the started app; setup_services and client live in conftest.py
+pytestmark = pytest.mark.usefixtures("setup_services")
 
-
-# Mock external services for testing
-@pytest.fixture(scope="session", autouse=True)
-def mock_external_services():
-    """Mock external services to avoid real connections during testing"""
-    with patch('app.core.dependencies.MongoDBService') as mock_mongodb, \
-         patch('app.core.dependencies.AnthropicService') as mock_anthropic, \
-         patch('app.core.dependencies.OCRService') as mock_ocr:
-        
-        # Mock MongoDB service
-        mock_mongodb_instance = MagicMock()
-        mock_mongodb_instance.store_document.return_value = "test_document_id"
-        mock_mongodb.return_value = mock_mongodb_instance
-        
-        # Mock Anthropic service
-        mock_anthropic_instance = MagicMock()
-        mock_anthropic_instance.analyze_hr_document.return_value = {
-            "name": "João Silva",
-            "position": "Developer"
-        }
-        mock_anthropic_instance.generate_document_summary.return_value = {
-            "summary": "Test summary",
-            "key_points": ["Point 1", "Point 2"]
-        }
-        # Make the methods async
-        mock_anthropic_instance.analyze_hr_document = MagicMock()
-        mock_anthropic_instance.analyze_hr_document.return_value = {
-            "name": "João Silva",
-            "position": "Developer"
-        }
-        mock_anthropic_instance.generate_document_summary = MagicMock()
-        mock_anthropic_instance.generate_document_summary.return_value = {
-            "summary": "Test summary",
-            "key_points": ["Point 1", "Point 2"]
-        }
-        mock_anthropic.return_value = mock_anthropic_instance
-        
-        # Mock OCR service
-        mock_ocr_instance = MagicMock()
-        mock_ocr_instance.extract_text_from_pdf.return_value = "Extracted text from PDF"
-        mock_ocr.return_value = mock_ocr_instance
-        
-        yield
-
-# Initialize services for testing
-@pytest.fixture(scope="session", autouse=True)
-def setup_services(mock_external_services):
-    """Initialize services before running tests and clean up afterwards"""
-    initialize_services()
-    yield
-    shutdown_services()
-
-# Create test client fixture
-@pytest.fixture(scope="session")
-def client():
-    """Create test client for API testing"""
-    try:
-        return TestClient(app)
-    except Exception as e:
-        pytest.fail(f"Failed to create TestClient: {e}")
-
-# Simple test to verify TestClient works
-def test_client_initialization(client):
-    """Test that TestClient can be initialized and make basic requests"""
-    assert client is not None
-    # Try a simple request to verify the client works
-    response = client.get("/health")
-    assert response.status_code in [200, 404, 500]  # Any response means client works
-
-# Test data fixtures
 @pytest.fixture
-def valid_hr_data_dict():
-    """Valid HR data dictionary for testing"""
-    return {
+def mock_validation_service(mock_validation_service):
+    """Make the overridden validation service return the cached minimal HRData"""
+    mock_validation_service.validate_hr_data.return_value = _hr_data("minimal")
+    return mock_validation_service
+
+# Test data shared by the whole session; none of the tests mutate it
+HR_DATA_DICTS = {
+    "valid": {
         "name": "João Silva",
         "cpf": "529.982.247-25",
         "position": "Software Engineer",
@@ -114,12 +43,8 @@ def valid_hr_data_dict():
                 "technologies_used": ["React", "Node.js"]
             }
         ]
-    }
-
-@pytest.fixture
-def invalid_hr_data_dict():
-    """Invalid HR data dictionary for testing validation"""
-    return {
+    },
+    "invalid": {
         "name": "Jo",  # Too short
         "cpf": "123.456.789-00",  # Invalid CPF
         "position": "A",  # Too short
@@ -128,12 +53,8 @@ def invalid_hr_data_dict():
         "main_skills": ["A"],  # Too short
         "hard_skills": ["A"],  # Too short
         "work_experience": []
-    }
-
-@pytest.fixture
-def minimal_valid_hr_data_dict():
-    """Minimal valid HR data for testing"""
-    return {
+    },
+    "minimal": {
         "name": "João Silva",
         "cpf": "529.982.247-25",
         "position": "Developer",
@@ -142,56 +63,124 @@ def minimal_valid_hr_data_dict():
         "main_skills": ["Leadership", "Communication"],
         "hard_skills": ["Python", "React"],
         "work_experience": []
+    },
+}
+
+# Request bodies for the shared dicts, serialized once
+HR_DATA_JSON = {key: orjson.dumps(data) for key, data in HR_DATA_DICTS.items()}
+JSON_HEADERS = {"content-type": "application/json"}
+
+def _json(response):
+    """Decode a response body with orjson instead of the stdlib json module"""
+    return orjson.loads(response.content)
+
+async def asgi_call(method, path, body=b""):
+    """Dispatch one request straight to the ASGI app and return (status, body)"""
+    response_complete = asyncio.Event()
+    request_sent = False
+    status = None
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 123),
+        "server": ("test", 80),
     }
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
 
-@pytest.fixture
-def mock_pdf_file():
-    """Mock PDF file for testing"""
-    return io.BytesIO(b"mock pdf content")
+# Mock PDF upload shared by every upload test; httpx encodes raw bytes directly
+PDF_BYTES = b"mock pdf content"
+PDF_UPLOAD = {"file": ("test.pdf", PDF_BYTES, "application/pdf")}
+
+@lru_cache(maxsize=None)
+def _hr_data(key):
+    """Build the HRData model for one of the shared dicts only once"""
+    return HRData(**HR_DATA_DICTS[key])
+
+# Fixed clock for the /health timestamp
+FROZEN_NOW = datetime(2024, 1, 1)
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW"""
 
-class TestHealthCheck:
-    """Test 1: Health Check Endpoint"""
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+@pytest.fixture(scope="module", autouse=True)
+def freeze_health_clock():
+    """Pin the clock the health check reads so its timestamp is deterministic"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.main.datetime", _FrozenDatetime)
+        yield
+
+# Test data fixtures
+@pytest.fixture(scope="session")
+def valid_hr_data_dict():
+    """Read-only valid HR data dictionary shared across the session"""
+    return MappingProxyType(HR_DATA_DICTS["valid"])
+
+@pytest.fixture(scope="session")
+def invalid_hr_data_dict():
+    """Read-only invalid HR data dictionary shared across the session"""
+    return MappingProxyType(HR_DATA_DICTS["invalid"])
+
+class TestReadOnlyEndpoints:
+    """Test 1: Read-only GET Endpoints"""
     
-    def test_health_check(self, client):
-        """Test that the health check endpoint returns healthy status"""
-        response = client.get("/health")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert "timestamp" in data
-        assert isinstance(data["timestamp"], str)
+    @pytest.mark.parametrize("path,status,keys", [
+        ("/health", 200, ("status", "timestamp")),
+        ("/v1/template", 200, ("name", "position", "cpf")),
+        ("/v1/template/developer", 200, ("position",)),
+        ("/v1/template/roles", 200, ("roles",)),
+        ("/v1/nonexistent", 404, ("detail",)),
+        ("/v1/nonexistent-endpoint", 404, ("detail",)),
+    ])
+    async def test_read_only_endpoint(self, path, status, keys):
+        """Test that each GET endpoint returns the expected status and a dict with the expected keys"""
+        response_status, body = await asgi_call("GET", path)
+        
+        assert response_status == status
+        data = orjson.loads(body)
+        assert isinstance(data, dict)
+        for key in keys:
+            assert key in data
 
 class TestTemplateEndpoints:
     """Test 2: Template Endpoints"""
     
-    def test_get_default_template(self, client):
-        """Test getting the default HR data template"""
-        response = client.get("/v1/template")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "name" in data
-        assert "position" in data
-        assert "cpf" in data
-    
-    def test_get_template_by_role(self, client):
-        """Test getting a role-specific template"""
-        response = client.get("/v1/template/developer")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "position" in data
-    
-    def test_get_available_roles(self, client):
+    async def test_get_available_roles(self, client):
         """Test getting list of available role templates"""
-        response = client.get("/v1/template/roles")
+        response = await client.get("/v1/template/roles")
         
-        assert response.status_code == 200
-        data = response.json()
-        assert "roles" in data
+        data = _json(response)
         assert isinstance(data["roles"], list)
         assert len(data["roles"]) > 0
         # Check for expected roles
@@ -202,285 +191,187 @@ class TestTemplateEndpoints:
 class TestDataValidation:
     """Test 3: Data Validation Endpoint"""
     
-    def test_validate_valid_data(self, client, valid_hr_data_dict):
+    async def test_validate_valid_data(self, valid_hr_data_dict):
         """Test validation of valid HR data"""
-        response = client.post("/v1/validate", json=valid_hr_data_dict)
+        # Call the handler directly; the service parses dates in place, so pass a copy
+        response = await validate_data(copy.deepcopy(dict(valid_hr_data_dict)), get_validation_service())
         
-        assert response.status_code == 200
-        data = response.json()
-        assert "valid" in data
+        data = orjson.loads(response.body)
         assert data["valid"] is True
-        assert "data" in data
-        assert "errors" in data
+        # The JSON-mode dump must round-trip back into the model
+        assert HRData(**data["data"]).name == valid_hr_data_dict["name"]
+        assert data["errors"] == {}
     
-    def test_validate_invalid_data(self, client, invalid_hr_data_dict):
+    async def test_validate_invalid_data(self, invalid_hr_data_dict):
         """Test validation of invalid HR data"""
-        response = client.post("/v1/validate", json=invalid_hr_data_dict)
+        response = await validate_data(copy.deepcopy(dict(invalid_hr_data_dict)), get_validation_service())
         
-        assert response.status_code == 200
-        data = response.json()
-        assert "valid" in data
+        data = orjson.loads(response.body)
         assert data["valid"] is False
-        assert "errors" in data
+        assert data["data"] is None
         assert len(data["errors"]) > 0
 
+@pytest.mark.xdist_group("store")
 class TestDocumentStorage:
     """Test 4: Document Storage Endpoint"""
     
-    @patch('app.api.endpoints.get_mongodb_service')
-    @patch('app.api.endpoints.get_validation_service')
-    def test_store_valid_document(self, mock_validation, mock_mongodb, client, minimal_valid_hr_data_dict):
+    async def test_store_valid_document(self, client, mock_validation_service, stored_documents):
         """Test storing valid HR data document"""
-        # Mock MongoDB service
-        mock_mongodb_instance = MagicMock()
-        mock_mongodb_instance.store_document.return_value = "test_document_id"
-        mock_mongodb.return_value = mock_mongodb_instance
-        
-        # Mock validation service to return HRData object directly
-        mock_validation_instance = MagicMock()
-        mock_validation_instance.validate_hr_data.return_value = HRData(
-            name="João Silva",
-            cpf="529.982.247-25",
-            position="Developer",
-            salary=5000.00,
-            contract_type="CLT",
-            main_skills=["Leadership", "Communication"],
-            hard_skills=["Python", "React"],
-            work_experience=[]
-        )
-        mock_validation.return_value = mock_validation_instance
-        
-        response = client.post("/v1/store-document", json=minimal_valid_hr_data_dict)
-        
-        # Print response for debugging
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
+        response = await client.post("/v1/store-document", content=HR_DATA_JSON["minimal"], headers=JSON_HEADERS)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["status"] == "success"
-        assert "document_id" in data
-        assert data["document_id"] == "test_document_id"
+        assert data["document_id"] == "id-1"
+        assert stored_documents == [_hr_data("minimal").model_dump()]
     
-    def test_store_invalid_document(self, client, invalid_hr_data_dict):
+    async def test_store_concurrent_documents_in_batches(self, client, mock_validation_service, service_mocks, stored_documents):
+        """Test that concurrent store requests are coalesced into bulk inserts"""
+        store_bulk = service_mocks.mongodb.store_documents_bulk
+        
+        responses = await asyncio.gather(*(
+            client.post("/v1/store-document", content=HR_DATA_JSON["minimal"], headers=JSON_HEADERS)
+            for _ in range(64)
+        ))
+        
+        assert all(response.status_code == 200 for response in responses)
+        document_ids = {_json(response)["document_id"] for response in responses}
+        assert document_ids == {f"id-{i}" for i in range(1, 65)}
+        assert len(stored_documents) == 64
+        assert store_bulk.call_count < 64
+    
+    async def test_store_invalid_document(self, client):
         """Test storing invalid HR data document"""
-        response = client.post("/v1/store-document", json=invalid_hr_data_dict)
+        response = await client.post("/v1/store-document", content=HR_DATA_JSON["invalid"], headers=JSON_HEADERS)
         
         assert response.status_code == 422
-        data = response.json()
+        data = _json(response)
         assert "detail" in data
 
 class TestPDFProcessing:
     """Test 5: PDF Processing Endpoint"""
     
-    @patch('app.api.endpoints.get_anthropic_service')
-    @patch('app.api.endpoints.get_validation_service')
-    def test_process_valid_pdf(self, mock_validation, mock_anthropic, client):
+    async def test_process_valid_pdf(self, client, mock_ocr_service, mock_anthropic_service, mock_validation_service):
         """Test processing a valid PDF document"""
-        # Mock Anthropic service to return a coroutine
-        async def mock_analyze_hr_document(text):
-            return {"name": "João Silva", "position": "Developer"}
-        
-        mock_anthropic_instance = MagicMock()
-        mock_anthropic_instance.analyze_hr_document = mock_analyze_hr_document
-        mock_anthropic.return_value = mock_anthropic_instance
-        
-        # Mock validation service
-        mock_validation_instance = MagicMock()
-        mock_validation_instance.validate_hr_data.return_value = HRData(
-            name="João Silva",
-            cpf="529.982.247-25",
-            position="Developer",
-            salary=5000.00,
-            contract_type="CLT"
-        )
-        mock_validation.return_value = mock_validation_instance
-        
-        # Create mock PDF file
-        files = {"file": ("test.pdf", io.BytesIO(b"mock pdf content"), "application/pdf")}
+        # Mock Anthropic service; the endpoint awaits the result
+        mock_anthropic_service.analyze_hr_document.return_value = {
+            "name": "João Silva", "position": "Developer"
+        }
+        # mock_validation_service returns the cached minimal HRData
         
-        response = client.post("/v1/process-pdf", files=files)
+        response = await client.post("/v1/process-pdf", files=PDF_UPLOAD)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "hr_data" in data
         assert "errors" in data
+        mock_ocr_service.extract_text_from_pdf.assert_called_once_with(PDF_BYTES)
+        mock_anthropic_service.analyze_hr_document.assert_awaited_once_with("Extracted text from PDF")
     
-    def test_process_invalid_file_type(self, client):
+    async def test_process_invalid_file_type(self, client):
         """Test processing with invalid file type"""
-        files = {"file": ("test.txt", io.BytesIO(b"text content"), "text/plain")}
+        files = {"file": ("test.txt", b"text content", "text/plain")}
         
-        response = client.post("/v1/process-pdf", files=files)
+        response = await client.post("/v1/process-pdf", files=files)
         
         assert response.status_code == 400
-        data = response.json()
+        data = _json(response)
         assert "detail" in data
         assert "File must be a PDF" in data["detail"]
 
 class TestPDFSummarization:
     """Test 6: PDF Summarization Endpoint"""
     
-    @patch('app.api.endpoints.get_anthropic_service')
-    def test_summarize_pdf(self, mock_anthropic, client):
+    async def test_summarize_pdf(self, client, mock_ocr_service, mock_anthropic_service):
         """Test PDF summarization functionality"""
-        # Mock Anthropic service to return a coroutine
-        async def mock_generate_document_summary(text):
-            return {"summary": "Test summary", "key_points": ["Point 1", "Point 2"]}
-        
-        mock_anthropic_instance = MagicMock()
-        mock_anthropic_instance.generate_document_summary = mock_generate_document_summary
-        mock_anthropic.return_value = mock_anthropic_instance
-        
-        files = {"file": ("test.pdf", io.BytesIO(b"mock pdf content"), "application/pdf")}
+        # Mock Anthropic service; the endpoint awaits the result
+        mock_anthropic_service.generate_document_summary.return_value = {
+            "summary": "Test summary", "key_points": ["Point 1", "Point 2"]
+        }
         
-        response = client.post("/v1/summarize-pdf", files=files)
+        response = await client.post("/v1/summarize-pdf", files=PDF_UPLOAD)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "summary" in data
         assert "key_points" in data
+        mock_ocr_service.extract_text_from_pdf.assert_called_once_with(PDF_BYTES)
+        mock_anthropic_service.generate_document_summary.assert_awaited_once_with("Extracted text from PDF")
 
 class TestErrorHandling:
     """Test 7: Error Handling"""
     
-    def test_invalid_endpoint(self, client):
-        """Test handling of invalid endpoint"""
-        response = client.get("/v1/nonexistent-endpoint")
-        
-        assert response.status_code == 404
-    
-    def test_invalid_json_payload(self, client):
+    async def test_invalid_json_payload(self, client):
         """Test handling of invalid JSON payload"""
         # Test with malformed JSON that will cause parsing error
-        response = client.post(
+        response = await client.post(
             "/v1/validate", 
             json={"name": "test", "invalid_field": None}  # This will cause validation errors
         )
         
         assert response.status_code == 200  # Validation endpoint returns 200 with errors
-        data = response.json()
+        data = _json(response)
         assert "valid" in data
         assert data["valid"] is False
+    
+    async def test_malformed_json_body(self, client):
+        """Test that a body that is not valid JSON is rejected with 422"""
+        response = await client.post("/v1/validate", content=b'{"name": ', headers=JSON_HEADERS)
+        
+        assert response.status_code == 422
+        data = _json(response)
+        assert data["detail"][0]["type"] == "json_invalid"
 
+@pytest.mark.xdist_group("store")
 class TestDataFlow:
     """Test 8: Complete Data Flow"""
     
-    @patch('app.api.endpoints.get_mongodb_service')
-    @patch('app.api.endpoints.get_validation_service')
-    def test_complete_workflow(self, mock_validation, mock_mongodb, client, minimal_valid_hr_data_dict):
+    async def test_complete_workflow(self, client, mock_validation_service, stored_documents):
         """Test complete workflow: validate -> store"""
-        # Mock MongoDB service
-        mock_mongodb_instance = MagicMock()
-        mock_mongodb_instance.store_document.return_value = "test_document_id"
-        mock_mongodb.return_value = mock_mongodb_instance
-        
-        # Mock validation service with different methods
-        mock_validation_instance = MagicMock()
-        # For validate_data_without_storing (used by /v1/validate)
-        mock_validation_instance.validate_data_without_storing.return_value = {
+        # For validate_data_without_storing (used by /v1/validate); the fixture
+        # already makes validate_hr_data (used by /v1/store-document) return it
+        mock_validation_service.validate_data_without_storing.return_value = {
             "valid": True,
-            "data": HRData(
-                name="João Silva",
-                cpf="529.982.247-25",
-                position="Developer",
-                salary=5000.00,
-                contract_type="CLT"
-            ),
+            "data": _hr_data("minimal"),
             "errors": {}
         }
-        # For validate_hr_data (used by /v1/store-document)
-        mock_validation_instance.validate_hr_data.return_value = HRData(
-            name="João Silva",
-            cpf="529.982.247-25",
-            position="Developer",
-            salary=5000.00,
-            contract_type="CLT"
-        )
-        mock_validation.return_value = mock_validation_instance
         
         # Step 1: Validate data
-        validate_response = client.post("/v1/validate", json=minimal_valid_hr_data_dict)
+        validate_response = await client.post("/v1/validate", content=HR_DATA_JSON["minimal"], headers=JSON_HEADERS)
         assert validate_response.status_code == 200
-        validate_data = validate_response.json()
+        validate_data = _json(validate_response)
         assert validate_data["valid"] is True
         
         # Step 2: Store validated data
-        store_response = client.post("/v1/store-document", json=minimal_valid_hr_data_dict)
+        store_response = await client.post("/v1/store-document", content=HR_DATA_JSON["minimal"], headers=JSON_HEADERS)
         assert store_response.status_code == 200
         
-        data = store_response.json()
+        data = _json(store_response)
         assert data["status"] == "success"
-        assert data["document_id"] == "test_document_id"
+        assert data["document_id"] == "id-1"
+        assert len(stored_documents) == 1
 
 class TestConcurrentRequests:
     """Test 9: Concurrent Request Handling"""
     
-    def test_concurrent_health_checks(self, client):
-        """Test handling of concurrent health check requests"""
-        import threading
-        import time
-        
-        results = []
-        errors = []
-        
-        def make_request():
-            try:
-                response = client.get("/health")
-                results.append(response.status_code)
-            except Exception as e:
-                errors.append(str(e))
-        
-        # Create multiple threads
-        threads = []
-        for _ in range(5):
-            thread = threading.Thread(target=make_request)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+    @pytest.mark.parametrize("n", [1, 32, 128])
+    async def test_concurrent_health_checks(self, client, n):
+        """Test handling of n concurrent health check requests"""
+        responses = await asyncio.gather(*(client.get("/health") for _ in range(n)))
         
         # Verify all requests succeeded
-        assert len(errors) == 0
-        assert len(results) == 5
-        assert all(status == 200 for status in results)
+        assert len(responses) == n
+        assert all(response.status_code == 200 for response in responses)
+        assert all(_json(response) == {"status": "healthy", "timestamp": "2024-01-01T00:00:00"} for response in responses)
 
 class TestAPIBehavior:
     """Test 10: API Behavior and Consistency"""
     
-    def test_api_response_format_consistency(self, client):
-        """Test that API responses maintain consistent format"""
-        # Test health endpoint
-        health_response = client.get("/health")
-        assert health_response.status_code == 200
-        health_data = health_response.json()
-        assert isinstance(health_data, dict)
-        
-        # Test template endpoint
-        template_response = client.get("/v1/template")
-        assert template_response.status_code == 200
-        template_data = template_response.json()
-        assert isinstance(template_data, dict)
-        
-        # Test roles endpoint
-        roles_response = client.get("/v1/template/roles")
-        assert roles_response.status_code == 200
-        roles_data = roles_response.json()
-        assert isinstance(roles_data, dict)
-        assert "roles" in roles_data
-    
-    def test_error_response_format(self, client):
+    async def test_error_response_format(self, client):
         """Test that error responses maintain consistent format"""
-        # Test 404 error
-        response = client.get("/v1/nonexistent")
-        assert response.status_code == 404
-        data = response.json()
-        assert "detail" in data
-        
-        # Test 422 error with invalid data
-        response = client.post("/v1/validate", json={"invalid": "data"})
+        # 404 bodies are covered by TestReadOnlyEndpoints; check validation errors here
+        response = await client.post("/v1/validate", json={"invalid": "data"})
         assert response.status_code == 200  # Validation endpoint returns 200 with errors
-        data = response.json()
+        data = _json(response)
         assert "valid" in data
         assert "errors" in data 
\ No newline at end of file
@@ -1,6 +1,6 @@
 from datetime import datetime
 from io import BytesIO
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytesseract
 import pytest
@@ -9,13 +9,13 @@ from pdf2image.pdf2image import convert_from_bytes
 from PIL import Image
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_bytes():
     """Sample PDF bytes for testing"""
     return b"fake_pdf_content"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text():
     """Sample text extracted from PDF"""
     return """
@@ -29,7 +29,7 @@ def sample_text():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text_with_missing_fields():
     """Sample text with some missing fields"""
     return """
@@ -40,7 +40,7 @@ def sample_text_with_missing_fields():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text_no_fields():
     """Sample text with no recognizable fields"""
     return """
@@ -55,45 +55,81 @@ class TestOCRService:
 
     # ---------- EXTRACT TEXT FROM PDF ----------
     
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 2})
     @patch('app.services.ocr_service.convert_from_bytes')
     @patch('app.services.ocr_service.pytesseract.image_to_string')
-    def test_extract_text_from_pdf_success(self, mock_pytesseract, mock_convert, sample_pdf_bytes):
+    def test_extract_text_from_pdf_success(self, mock_pytesseract, mock_convert, mock_pdfinfo, sample_pdf_bytes):
         """Test successful text extraction from PDF"""
         # Mock PDF to image conversion
         mock_image1 = Mock()
         mock_image2 = Mock()
         mock_convert.return_value = [mock_image1, mock_image2]
         
-        # Mock OCR text extraction
-        mock_pytesseract.side_effect = ["Texto da página 1", "Texto da página 2"]
+        # Mock OCR text extraction per image; pages may be recognised concurrently
+        page_texts = {mock_image1: "Texto da página 1", mock_image2: "Texto da página 2"}
+        mock_pytesseract.side_effect = lambda image, lang: page_texts[image]
         
         result = OCRService.extract_text_from_pdf(sample_pdf_bytes)
         
-        # Verify calls
-        mock_convert.assert_called_once_with(sample_pdf_bytes)
+        # Verify calls; two pages fit in the first chunk
+        mock_pdfinfo.assert_called_once_with(sample_pdf_bytes)
+        mock_convert.assert_called_once_with(sample_pdf_bytes, first_page=1, last_page=2, thread_count=ANY)
         assert mock_pytesseract.call_count == 2
         assert result == "Texto da página 1Texto da página 2"
 
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 5})
     @patch('app.services.ocr_service.convert_from_bytes')
-    def test_extract_text_from_pdf_empty_pdf(self, mock_convert, sample_pdf_bytes):
-        """Test text extraction from empty PDF"""
-        mock_convert.return_value = []
+    @patch('app.services.ocr_service.pytesseract.image_to_string')
+    def test_extract_text_from_pdf_multiple_chunks(self, mock_pytesseract, mock_convert, mock_pdfinfo, sample_pdf_bytes):
+        """Test that long PDFs are converted and recognised chunk by chunk, in page order"""
+        pages = [Mock() for _ in range(5)]
+        mock_convert.side_effect = [pages[:4], pages[4:]]
+        mock_pytesseract.side_effect = lambda image, lang: f"[{pages.index(image) + 1}]"
+        
+        result = OCRService.extract_text_from_pdf(sample_pdf_bytes)
         
+        assert mock_convert.call_args_list == [
+            call(sample_pdf_bytes, first_page=1, last_page=4, thread_count=ANY),
+            call(sample_pdf_bytes, first_page=5, last_page=5, thread_count=ANY),
+        ]
+        assert result == "[1][2][3][4][5]"
+
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 9})
+    @patch('app.services.ocr_service.convert_from_bytes')
+    @patch('app.services.ocr_service.pytesseract.image_to_string')
+    def test_extract_text_from_pdf_short_chunk_keeps_later_pages(self, mock_pytesseract, mock_convert, mock_pdfinfo, sample_pdf_bytes):
+        """Test that a chunk missing a page doesn't stop the pages after it from being recognised"""
+        pages = [Mock() for _ in range(9)]
+        mock_convert.side_effect = [pages[:3], pages[4:8], pages[8:]]
+        mock_pytesseract.side_effect = lambda image, lang: f"[{pages.index(image) + 1}]"
+        
+        result = OCRService.extract_text_from_pdf(sample_pdf_bytes)
+        
+        assert mock_convert.call_count == 3
+        assert result == "[1][2][3][5][6][7][8][9]"
+
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 0})
+    @patch('app.services.ocr_service.convert_from_bytes')
+    def test_extract_text_from_pdf_empty_pdf(self, mock_convert, mock_pdfinfo, sample_pdf_bytes):
+        """Test text extraction from empty PDF"""
         result = OCRService.extract_text_from_pdf(sample_pdf_bytes)
         
+        mock_convert.assert_not_called()
         assert result == ""
 
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 1})
     @patch('app.services.ocr_service.convert_from_bytes')
-    def test_extract_text_from_pdf_conversion_error(self, mock_convert, sample_pdf_bytes):
+    def test_extract_text_from_pdf_conversion_error(self, mock_convert, mock_pdfinfo, sample_pdf_bytes):
         """Test handling of PDF conversion error"""
         mock_convert.side_effect = Exception("PDF conversion failed")
         
         with pytest.raises(Exception, match="PDF conversion failed"):
             OCRService.extract_text_from_pdf(sample_pdf_bytes)
 
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 1})
     @patch('app.services.ocr_service.convert_from_bytes')
     @patch('app.services.ocr_service.pytesseract.image_to_string')
-    def test_extract_text_from_pdf_ocr_error(self, mock_pytesseract, mock_convert, sample_pdf_bytes):
+    def test_extract_text_from_pdf_ocr_error(self, mock_pytesseract, mock_convert, mock_pdfinfo, sample_pdf_bytes):
         """Test handling of OCR error"""
         mock_image = Mock()
         mock_convert.return_value = [mock_image]
@@ -352,9 +388,10 @@ class TestOCRService:
 
     # ---------- INTEGRATION TESTS ----------
     
+    @patch('app.services.ocr_service.pdfinfo_from_bytes', return_value={"Pages": 1})
     @patch('app.services.ocr_service.convert_from_bytes')
     @patch('app.services.ocr_service.pytesseract.image_to_string')
-    def test_full_ocr_pipeline(self, mock_pytesseract, mock_convert, sample_pdf_bytes):
+    def test_full_ocr_pipeline(self, mock_pytesseract, mock_convert, mock_pdfinfo, sample_pdf_bytes):
         """Test the complete OCR pipeline from PDF to HR data"""
         # Mock PDF to image conversion
         mock_image = Mock()
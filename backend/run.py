@@ -1,39 +1,33 @@
 import os
-import subprocess
-import sys
 
-from dotenv import load_dotenv
+import uvicorn
+
+from app.core.env import load_env
 
 
 def main():
-    # Load environment variables from .env file
-    load_dotenv()
+    # Load environment variables from .env file; the server process and its
+    # reload/worker children see the flag and skip reading it again
+    load_env()
     
     # Get configuration from environment with defaults
     host = os.getenv('HOST', '0.0.0.0')
-    port = os.getenv('PORT', '8000')
+    port = int(os.getenv('PORT', '8000'))
     reload = os.getenv('DEBUG', 'True').lower() == 'true'
+    workers = int(os.getenv('WORKERS', '1'))
     
-    # Construct the uvicorn command
-    cmd = [
-        sys.executable, '-m', 'uvicorn',
+    # Run uvicorn in this process instead of spawning a second interpreter.
+    # loop/http "auto" pick uvloop and httptools when they are installed and
+    # fall back to asyncio and h11 otherwise (e.g. on Windows)
+    uvicorn.run(
         'app.main:app',
-        '--host', host,
-        '--port', port
-    ]
-    
-    if reload:
-        cmd.append('--reload')
-    
-    # Run uvicorn with the specified configuration
-    try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error starting server: {e}")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        print("\nServer stopped by user")
-        sys.exit(0)
+        host=host,
+        port=port,
+        reload=reload,
+        workers=None if reload else workers,
+        loop='auto',
+        http='auto'
+    )
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()